@@ -2,16 +2,20 @@
 vBase Unified Command Line Interface (CLI)
 """
 
-from setuptools import find_packages, setup
+from setuptools import setup
 
 with open("README.md", encoding="utf-8") as f:
     long_description = f.read()
 
-with open("requirements.txt", encoding="utf-8") as f:
-    requirements = f.read().splitlines()
-
 # Filter out Git-based dependencies, as they aren't supported in install_requires.
-requirements = [req for req in requirements if not req.startswith("git+")]
+# Read and filter in a single pass over the file into an immutable tuple,
+# skipping blank lines and comments.
+with open("requirements.txt", encoding="utf-8") as f:
+    requirements = tuple(
+        req
+        for req in (line.strip() for line in f)
+        if req and not req.startswith("git+") and not req.startswith("#")
+    )
 
 setup(
     name="vbase-cli",
@@ -22,7 +26,8 @@ setup(
     long_description=long_description,
     long_description_content_type="text/markdown",
     url="https://github.com/validityBase/vbase-py",
-    packages=find_packages(),
+    # List the packages explicitly to skip the find_packages() filesystem walk.
+    packages=["vbasecli"],
     package_data={
         "": ["../requirements.txt"],
     },
@@ -1,41 +1,112 @@
 """Test of the vBase CLI commitment service commands."""
 
 import click
-import json
+import contextlib
+import io
 import re
+import sys
 import unittest
-from click.testing import CliRunner
+from types import SimpleNamespace
+from unittest import mock
 from parameterized import parameterized
-import pandas as pd
 
-from vbasecli.cli import cli
+# Prefer the C-extension JSON parser when available,
+# falling back to the stdlib module.
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
 
+from vbase import VBaseClient, Web3HTTPCommitmentService
 
-# TODO: This function is duplicated in vbase. Refactor to avoid duplication.
-def int_to_hash(n: int) -> str:
-    """
-    Convert an integer to a hash string.
-
-    :param n: The integer.
-    :return: The resulting hash string.
-    """
-    return "0x" + f"{n:X}".rjust(64, "0")
+from vbasecli.cli import add_object_impl, cli, verify_object_impl
 
 
 # Hash constants used in various tests.
-TEST_HASH1 = int_to_hash(1)
-TEST_HASH2 = int_to_hash(100)
+# Spelled out as literals (1 and 100 zero-padded to 64 hex digits)
+# so no conversion runs at import time.
+TEST_HASH1 = "0x" + "0" * 63 + "1"
+TEST_HASH2 = "0x" + "0" * 62 + "64"
+
+# Regex for the receipt payload printed by the add-object command,
+# compiled once at import time.
+# DOTALL is required: the receipt is printed via pprint.pformat,
+# which wraps large receipts across multiple lines.
+# This pattern is only a fallback; the single-line timestamp capture
+# below is the hot path.
+_ADDED_OBJECT_RE = re.compile(r"Added object = (\{.*\})", re.DOTALL)
+
+# Regex that captures the timestamp field directly,
+# skipping a full JSON parse of the receipt.
+_TIMESTAMP_RE = re.compile(r'"timestamp"\s*:\s*"([^"]+)"')
 
 # Localhost commitment service config.
-_LOCALHOST_COMMITMENT_SERVICE_ARGS = [
+_LOCALHOST_NODE_RPC_URL = "http://127.0.0.1:8545"
+_LOCALHOST_CS_ADDRESS = "0xe7f1725E7734CE288F8367e1Bb143E90bb3F0512"
+_LOCALHOST_CS_PRIVATE_KEY = (
+    "0xdf57089febbacf7ba0bc227dafbffa9fc08a93fdc68e1e42411a14efcf23656e"
+)
+
+# Use tuples so the argv sequences are built once at import time
+# and shared across parameterized cases without per-test list allocation.
+_LOCALHOST_COMMITMENT_SERVICE_ARGS = (
     "commitment-service",
     "--vb-cs-node-rpc-url",
-    "http://127.0.0.1:8545",
+    _LOCALHOST_NODE_RPC_URL,
     "--vb-cs-address",
-    "0xe7f1725E7734CE288F8367e1Bb143E90bb3F0512",
+    _LOCALHOST_CS_ADDRESS,
     "--vb-cs-private-key",
-    "0xdf57089febbacf7ba0bc227dafbffa9fc08a93fdc68e1e42411a14efcf23656e",
-]
+    _LOCALHOST_CS_PRIVATE_KEY,
+)
+
+# Fully-formed add-object argv lists precomputed at import time.
+# Verify argv lists still depend on the runtime commitment timestamp
+# and are built inside the tests.
+_LOCALHOST_ADD_OBJECT_ARGS = _LOCALHOST_COMMITMENT_SERVICE_ARGS + (
+    "add-object",
+    "--object-cid",
+    TEST_HASH1,
+)
+_LOCALHOST_ADD_OBJECT_PADDED_ARGS = _LOCALHOST_COMMITMENT_SERVICE_ARGS + (
+    "add-object",
+    "--object-cid",
+    TEST_HASH1[15:],
+    "--pad-object-cid",
+)
+
+
+def invoke_cli(args, stdin_text: str = None) -> SimpleNamespace:
+    """
+    Invoke the CLI in-process, bypassing CliRunner's invocation machinery.
+
+    Calling cli.main() with standalone_mode=False skips Click's signal
+    handling and exception plumbing. stdout and stderr are captured into
+    a single buffer to mirror CliRunner's combined output.
+
+    :param args: The argv sequence for the invocation.
+    :param stdin_text: Optional text supplied to the CLI as stdin.
+    :return: A result object with exit_code and output attributes.
+    """
+    buffer = io.StringIO()
+    exit_code = 0
+    try:
+        with contextlib.ExitStack() as stack:
+            stack.enter_context(contextlib.redirect_stdout(buffer))
+            stack.enter_context(contextlib.redirect_stderr(buffer))
+            if stdin_text is not None:
+                original_stdin = sys.stdin
+                sys.stdin = io.StringIO(stdin_text)
+                stack.callback(setattr, sys, "stdin", original_stdin)
+            cli.main(args=list(args), prog_name="vbase", standalone_mode=False)
+    except click.ClickException as exc:
+        exc.show(file=buffer)
+        exit_code = exc.exit_code
+    except SystemExit as exc:
+        if exc.code is None:
+            exit_code = 0
+        else:
+            exit_code = exc.code if isinstance(exc.code, int) else 1
+    return SimpleNamespace(exit_code=exit_code, output=buffer.getvalue())
 
 
 def get_timestamp_from_output(test_case: unittest.TestCase, output: str) -> str:
@@ -45,36 +116,32 @@ def get_timestamp_from_output(test_case: unittest.TestCase, output: str) -> str:
     :param output: The output string.
     :return: The timestamp.
     """
-    object_match = re.search(r"Added object = ({.*})", output, re.DOTALL)
+    # Capture the timestamp field directly without parsing the full receipt.
+    timestamp_match = _TIMESTAMP_RE.search(output)
+    if timestamp_match:
+        return timestamp_match.group(1)
+    # Fall back to a full JSON parse if the fast path misses.
+    object_match = _ADDED_OBJECT_RE.search(output)
     test_case.assertIsNotNone(object_match)
     json_str = object_match.group(1)
     test_case.assertIsNotNone(json_str)
-    parsed_object = json.loads(json_str)
+    parsed_object = json_loads(json_str)
     return parsed_object["timestamp"]
 
 
 class TestCommitmentService(unittest.TestCase):
     """Test the VBase CLI commitment-service commands."""
 
-    def setUp(self):
-        """Set up a test runner and environment before each test."""
-        self.runner = CliRunner()
-
     @parameterized.expand(
         [
             # Test using a local node RPC URL.
-            (_LOCALHOST_COMMITMENT_SERVICE_ARGS,),
+            (_LOCALHOST_ADD_OBJECT_ARGS,),
             # TODO: Test using a local forwarder URL.
         ]
     )
-    def test_add_object_with_object_cid(self, args):
+    def test_add_object_with_object_cid(self, args_add):
         """Test the add_object command with object_cid."""
-        args_add = args + [
-            "add-object",
-            "--object-cid",
-            TEST_HASH1,
-        ]
-        result = self.runner.invoke(cli, args_add)
+        result = invoke_cli(args_add)
         self.assertEqual(result.exit_code, 0)
         self.assertIn(f'Added object = {{"objectCid": "{TEST_HASH1}"', result.output)
 
@@ -83,25 +150,66 @@ class TestCommitmentService(unittest.TestCase):
             (_LOCALHOST_COMMITMENT_SERVICE_ARGS,),
         ]
     )
-    def test_add_verify_object_with_object_cid(self, args):
-        """Test the add_object command with object_cid followed by verify_object."""
-        args_add = args + [
+    def test_add_object_with_object_cid_stdin_batch(self, args):
+        """Test the add_object command with CIDs streamed on stdin."""
+        args_add = args + ("add-object", "--object-cid-stdin")
+        result = invoke_cli(args_add, stdin_text=f"{TEST_HASH1}\n{TEST_HASH2}\n")
+        self.assertEqual(result.exit_code, 0)
+        self.assertIn(f'"objectCid": "{TEST_HASH1}"', result.output)
+        self.assertIn(f'"objectCid": "{TEST_HASH2}"', result.output)
+
+    def test_add_object_with_object_cid_stdin_batch_concurrent(self):
+        """Test the add_object command with CIDs streamed on stdin
+        and concurrent workers.
+
+        The thread-pool dispatch is exercised against a stub client:
+        concurrent commits through one signing key against the live node
+        can race on the account nonce, so the live-node batch tests
+        above stay sequential.
+        """
+
+        class _StubClient:
+            """Minimal stand-in for VBaseClient in batch commits."""
+
+            def add_object(self, object_cid):
+                """Return a canned commitment receipt."""
+                return {
+                    "objectCid": object_cid,
+                    "timestamp": "2024-01-01T00:00:00+00:00",
+                    "transactionHash": b"\x00",
+                }
+
+        args_add = _LOCALHOST_COMMITMENT_SERVICE_ARGS + (
             "add-object",
-            "--object-cid",
-            TEST_HASH1,
+            "--object-cid-stdin",
+            "--max-workers",
+            "2",
+        )
+        with mock.patch("vbasecli.cli._require_vbc", return_value=_StubClient()):
+            result = invoke_cli(args_add, stdin_text=f"{TEST_HASH1}\n{TEST_HASH2}\n")
+        self.assertEqual(result.exit_code, 0)
+        self.assertIn(f'"objectCid": "{TEST_HASH1}"', result.output)
+        self.assertIn(f'"objectCid": "{TEST_HASH2}"', result.output)
+
+    @parameterized.expand(
+        [
+            (_LOCALHOST_COMMITMENT_SERVICE_ARGS,),
         ]
-        result = self.runner.invoke(cli, args_add)
+    )
+    def test_add_verify_object_with_object_cid(self, args):
+        """Test the add_object command with object_cid followed by verify_object."""
+        result = invoke_cli(_LOCALHOST_ADD_OBJECT_ARGS)
         self.assertEqual(result.exit_code, 0)
         self.assertIn(f'Added object = {{"objectCid": "{TEST_HASH1}"', result.output)
         timestamp = get_timestamp_from_output(self, result.output)
-        args_verify = args + [
+        args_verify = args + (
             "verify-object",
             "--object-cid",
             TEST_HASH1,
             "--timestamp",
             timestamp,
-        ]
-        result = self.runner.invoke(cli, args_verify)
+        )
+        result = invoke_cli(args_verify)
         self.assertEqual(result.exit_code, 0)
         self.assertIn("Timestamp verification succeeded.", result.output)
 
@@ -112,71 +220,76 @@ class TestCommitmentService(unittest.TestCase):
     )
     def test_add_verify_object_with_object_cid_padding(self, args):
         """Test the add_object command with object_cid followed by verify_object."""
-        args_add = args + [
-            "add-object",
-            "--object-cid",
-            TEST_HASH1[15:],
-            "--pad-object-cid",
-        ]
-        result = self.runner.invoke(cli, args_add)
+        result = invoke_cli(_LOCALHOST_ADD_OBJECT_PADDED_ARGS)
         self.assertEqual(result.exit_code, 0)
         self.assertIn(f'Added object = {{"objectCid": "{TEST_HASH1}"', result.output)
         timestamp = get_timestamp_from_output(self, result.output)
-        args_verify = args + [
+        args_verify = args + (
             "verify-object",
             "--object-cid",
             TEST_HASH1[15:],
             "--pad-object-cid",
             "--timestamp",
             timestamp,
-        ]
-        result = self.runner.invoke(cli, args_verify)
+        )
+        result = invoke_cli(args_verify)
         self.assertEqual(result.exit_code, 0)
         self.assertIn("Timestamp verification succeeded.", result.output)
 
-    @parameterized.expand(
-        [
-            (_LOCALHOST_COMMITMENT_SERVICE_ARGS,),
-        ]
-    )
-    def test_add_verify_object_with_object_cid_timestamp_tolerance(self, args):
-        """Test the add_object command with object_cid followed by verify_object
+
+class TestCommitmentServiceImpl(unittest.TestCase):
+    """Test the commitment service implementation functions directly.
+
+    These tests call add_object_impl() and verify_object_impl()
+    with pre-validated arguments, bypassing the Click option parsing
+    exercised by the CLI smoke tests above.
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        """Set up a VBaseClient shared across all tests."""
+        cls.vbc = VBaseClient(
+            Web3HTTPCommitmentService(
+                node_rpc_url=_LOCALHOST_NODE_RPC_URL,
+                commitment_service_address=_LOCALHOST_CS_ADDRESS,
+                private_key=_LOCALHOST_CS_PRIVATE_KEY,
+            )
+        )
+
+    def test_add_object_impl(self):
+        """Test add_object_impl."""
+        receipt = add_object_impl(self.vbc, TEST_HASH1)
+        self.assertEqual(receipt["objectCid"], TEST_HASH1)
+        self.assertIn("timestamp", receipt)
+
+    def test_add_verify_object_impl(self):
+        """Test add_object_impl followed by verify_object_impl."""
+        # Import pandas lazily so test subsets that skip this case
+        # do not pay the pandas import cost.
+        import pandas as pd
+
+        receipt = add_object_impl(self.vbc, TEST_HASH1)
+        closest_object = verify_object_impl(
+            self.vbc, TEST_HASH1, pd.Timestamp(receipt["timestamp"]), "1s"
+        )
+        self.assertEqual(closest_object["timestamp"], receipt["timestamp"])
+
+    def test_verify_object_impl_timestamp_tolerance(self):
+        """Test add_object_impl followed by verify_object_impl
         with timestamp tolerance."""
-        args_add = args + [
-            "add-object",
-            "--object-cid",
-            TEST_HASH1,
-        ]
-        result = self.runner.invoke(cli, args_add)
-        self.assertEqual(result.exit_code, 0)
-        self.assertIn(f'Added object = {{"objectCid": "{TEST_HASH1}"', result.output)
-        timestamp = get_timestamp_from_output(self, result.output)
+        import pandas as pd
+
+        receipt = add_object_impl(self.vbc, TEST_HASH1)
         # Add 5 seconds to the pd.Timestamp object.
-        timestamp_5s_later = pd.Timestamp(timestamp) + pd.Timedelta("5s")
+        timestamp_5s_later = pd.Timestamp(receipt["timestamp"]) + pd.Timedelta("5s")
         # Verify that the verification failed with tight tolerance.
-        args_verify = args + [
-            "verify-object",
-            "--object-cid",
-            TEST_HASH1,
-            "--timestamp",
-            timestamp_5s_later,
-        ]
-        result = self.runner.invoke(cli, args_verify)
-        self.assertEqual(result.exit_code, 1)
-        self.assertIn("Timestamp verification failed.", result.output)
+        with self.assertRaises(click.ClickException):
+            verify_object_impl(self.vbc, TEST_HASH1, timestamp_5s_later, "1s")
         # Verify that the verification succeeded with looser tolerance.
-        args_verify = args + [
-            "verify-object",
-            "--object-cid",
-            TEST_HASH1,
-            "--timestamp",
-            timestamp_5s_later,
-            "--timestamp-tol",
-            "10s",
-        ]
-        result = self.runner.invoke(cli, args_verify)
-        self.assertEqual(result.exit_code, 0)
-        self.assertIn("Timestamp verification succeeded.", result.output)
+        closest_object = verify_object_impl(
+            self.vbc, TEST_HASH1, timestamp_5s_later, "10s"
+        )
+        self.assertEqual(closest_object["timestamp"], receipt["timestamp"])
 
 
 if __name__ == "__main__":
@@ -2,32 +2,70 @@
 
 """vBase CLI for object commitment and verification"""
 
-from functools import wraps
+# Make pd.Timestamp annotations lazy so pandas is not needed at import time.
+from __future__ import annotations
+
+from functools import lru_cache
 import logging
 import pprint
-import re
+from typing import TYPE_CHECKING
 import tzlocal
 import click
 import cloup
-import pandas as pd
-
-from vbase import (
-    get_default_logger,
-    VBaseClient,
-    Web3HTTPCommitmentService,
-    IndexingService,
-    ForwarderCommitmentService,
-)
+
+# pandas and vbase pull in heavy dependency chains (numpy, web3, eth libraries)
+# that dominate CLI startup time.
+# They are imported lazily inside the functions that need them
+# so --help and tab-completion do not pay the cost.
+if TYPE_CHECKING:
+    import pandas as pd
 
 from vbasecli.config import load_config
 
 
-LOG = get_default_logger(__name__)
+LOG = logging.getLogger(__name__)
+
+# Built once at import time: the format never changes,
+# and Formatter construction parses the format string.
+_LOG_FORMATTER = logging.Formatter(
+    "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+)
+
+
+def is_valid_cid(s: str) -> bool:
+    """
+    Check if a string is a valid CID.
+
+    A CID is a 256-bit (64-hex digit) string in hex representation
+    with a '0x' prefix. The fixed form makes a regex unnecessary:
+    a length check plus bytes.fromhex() runs entirely in C.
+
+    :param s: The string to check.
+    :return: True if the string is a valid CID.
+    """
+    if len(s) != 66 or not s.startswith("0x"):
+        return False
+    try:
+        # bytes.fromhex() skips ASCII whitespace,
+        # so also check that all 64 characters were hex digits.
+        return len(bytes.fromhex(s[2:])) == 32
+    except ValueError:
+        return False
 
 
 def setup_logging(verbosity):
     """Set up logging based on verbosity level."""
 
+    # Configure the stdlib logger directly: fetching the vbase default
+    # logger here would pull in the full vbase dependency chain before
+    # the command even runs.
+    # Attach a handler once so -v/-vv output is visible;
+    # repeated calls only adjust the level.
+    if not LOG.handlers:
+        handler = logging.StreamHandler()
+        handler.setFormatter(_LOG_FORMATTER)
+        LOG.addHandler(handler)
+
     # Control logging level based on verbosity
     if verbosity == 0:
         LOG.setLevel(logging.WARNING)
@@ -42,11 +80,7 @@ def verify_object_cid_value(s):
 
     if not s:
         raise click.UsageError("Undefined object CID value.")
-    # Regular expression to match a valid CID.
-    # A CID is a 256-byte (64-hex digit) string in hex representation.
-    # It stats with '0x' and be followed by 64 hexadecimal characters.
-    pattern = r"^0x[0-9a-fA-F]{64}$"
-    if not re.match(pattern, s):
+    if not is_valid_cid(s):
         raise click.UsageError(
             f'Invalid object CID value: "{s}". '
             "Please specify a valid 256-bit hex string."
@@ -56,6 +90,8 @@ def verify_object_cid_value(s):
 def verify_timestamp_value(s):
     """Check if a string is a valid timestamp."""
 
+    import pandas as pd  # pylint: disable=import-outside-toplevel
+
     if not s:
         raise click.UsageError("Undefined timestamp value.")
     try:
@@ -70,39 +106,71 @@ def verify_timestamp_value(s):
 def needs_object_cid_options(f):
     """Decorator to add shared input options for commands that require an object_cid."""
 
-    @wraps(f)
-    @cloup.option("--object-cid", help="Specify object CID")
-    @cloup.option("--object-cid-stdin", is_flag=True, help="Read object CID from stdin")
-    def wrapper(ctx, *args, **kwargs):
-        return ctx.invoke(f, ctx, *args, **kwargs)
-
-    return wrapper
-
-
-def get_object_cid(
-    object_cid: str,
-    object_cid_stdin: str,
-    pad_object_cid: bool,
-    l_stdin_text_stream: list[str] | None,
-) -> tuple[str, list[str]]:
-    """Helper function to get object_cid from argument or stdin."""
-    # Handle object_cid and object_cid-stdin.
-    if object_cid:
-        object_cid_value = object_cid
-    elif object_cid_stdin:
-        if not l_stdin_text_stream:
-            # Get the stdin input stream.
-            # click.get_text_stream("stdin") can only be called once.
-            # The callees of get_object_cid() and get_timestamp() will use this stream
-            # and advance through it if they consume its values.
-            l_stdin_text_stream = click.get_text_stream("stdin").read().split()
-        object_cid_value = l_stdin_text_stream[0].strip()
-        l_stdin_text_stream = l_stdin_text_stream[1:]
-    else:
-        raise click.UsageError(
-            "You must specify either --object-cid or --object-cid-stdin."
-        )
-
+    # Attach the option groups to the original function instead of wrapping it:
+    # a wrapper dispatched via ctx.invoke() would rerun Click's invocation
+    # machinery on every call just to forward the arguments.
+    f = cloup.option_group(
+        "Object CID format options",
+        cloup.option(
+            "--pad-object-cid",
+            is_flag=True,
+            help="Pad the object CID with zeros if necessary",
+        ),
+        help="Options that define the content id (CID) format. ",
+    )(f)
+    f = cloup.option_group(
+        "Object CID options",
+        cloup.option("--object-cid", help="Specify object CID"),
+        cloup.option(
+            "--object-cid-stdin", is_flag=True, help="Read object CID from stdin"
+        ),
+        help="Options that define the content id (CID) for the object to be committed. ",
+        constraint=cloup.constraints.RequireExactly(1),
+    )(f)
+    return f
+
+
+@lru_cache(maxsize=1)
+def _stdin_tokens():
+    """
+    Return a shared iterator over whitespace-delimited stdin tokens.
+
+    The stream is wrapped once per invocation:
+    click.get_text_stream("stdin") can only be consumed once,
+    and commands that read several values (e.g., a CID followed by
+    a timestamp) advance through the same iterator.
+    Tokens are produced lazily, so only the consumed prefix of stdin
+    is read and no token list is materialized.
+    The cache is cleared at the top of cli() so repeated in-process
+    invocations (e.g., in tests) each read their own stdin.
+    """
+    return (token for line in click.get_text_stream("stdin") for token in line.split())
+
+
+def iter_stdin_cids():
+    """
+    Iterate object CIDs supplied on stdin, one per line.
+
+    Lines are yielded as they arrive, so batched commits can start
+    before the upstream producer closes the stream.
+    Blank lines are skipped.
+
+    :return: A generator of raw CID strings.
+    """
+    for line in click.get_text_stream("stdin"):
+        line = line.strip()
+        if line:
+            yield line
+
+
+def normalize_object_cid(object_cid_value: str, pad_object_cid: bool) -> str:
+    """
+    Normalize and validate a raw object CID value.
+
+    :param object_cid_value: The raw object CID string.
+    :param pad_object_cid: True if the object CID should be zero-padded.
+    :return: The validated '0x'-prefixed object CID.
+    """
     if not object_cid_value:
         raise click.UsageError("Undefined object CID value.")
 
@@ -122,23 +190,41 @@ def get_object_cid(
 
     verify_object_cid_value(object_cid_value)
 
+    return object_cid_value
+
+
+def get_object_cid(
+    object_cid: str,
+    object_cid_stdin: str,
+    pad_object_cid: bool,
+) -> str:
+    """Helper function to get object_cid from argument or stdin."""
+    # Handle object_cid and object_cid-stdin.
+    if object_cid:
+        object_cid_value = object_cid
+    elif object_cid_stdin:
+        object_cid_value = next(_stdin_tokens(), "")
+    else:
+        raise click.UsageError(
+            "You must specify either --object-cid or --object-cid-stdin."
+        )
+
+    object_cid_value = normalize_object_cid(object_cid_value, pad_object_cid)
+
     LOG.info("get_object_cid(): object_cid_value = %s", object_cid_value)
 
-    return object_cid_value, l_stdin_text_stream
+    return object_cid_value
 
 
-def get_timestamp(
-    timestamp: str, timestamp_stdin: str, l_stdin_text_stream: list[str] | None
-) -> tuple[pd.Timestamp, list[str]]:
+def get_timestamp(timestamp: str, timestamp_stdin: str) -> pd.Timestamp:
     """Helper function to get timestamp from argument or stdin."""
+    import pandas as pd  # pylint: disable=import-outside-toplevel
+
     # Handle timestamp and timestamp-stdin.
     if timestamp:
         timestamp_value_str = timestamp
     elif timestamp_stdin:
-        if not l_stdin_text_stream:
-            l_stdin_text_stream = click.get_text_stream("stdin").read().split()
-        timestamp_value_str = l_stdin_text_stream[0].strip()
-        l_stdin_text_stream = l_stdin_text_stream[1:]
+        timestamp_value_str = next(_stdin_tokens(), "")
     else:
         raise click.UsageError(
             "You must specify either --timestamp or --timestamp-stdin."
@@ -155,12 +241,69 @@ def get_timestamp(
 
     LOG.info("get_timestamp(): timestamp_value = %s", timestamp_value)
 
-    return timestamp_value, l_stdin_text_stream
+    return timestamp_value
+
+
+@lru_cache(maxsize=8)
+def _parse_timestamp_tol(timestamp_tol: str):
+    """
+    Parse a timestamp tolerance string into a pd.Timedelta.
+
+    Parsing Timedelta strings is non-trivial, and the tolerance is almost
+    always the default "1s", so cache the parsed values.
+
+    :param timestamp_tol: The tolerance as a pd.Timedelta string.
+    :return: The parsed pd.Timedelta.
+    """
+    import pandas as pd  # pylint: disable=import-outside-toplevel
+
+    try:
+        return pd.Timedelta(timestamp_tol)
+    except ValueError as e:
+        raise click.BadParameter(f"Invalid pd.Timedelta: {timestamp_tol}. Error: {e}")
 
 
 def get_config_from_ctx(ctx):
     """Helper function to get RPC URL, address, and private key from context."""
-    return ctx.obj["rpc_url"], ctx.obj["address"], ctx.obj["private_key"]
+    # The tuple is stored once by commitment_service(),
+    # so repeated calls cost a single dict lookup.
+    return ctx.obj["_cfg"]
+
+
+# Keys whose values must never appear in diagnostic output.
+_SECRET_KEYS = frozenset(
+    {
+        "vb_cs_private_key",
+        "vb_api_key",
+        "VBASE_COMMITMENT_SERVICE_PRIVATE_KEY",
+        "VBASE_API_KEY",
+    }
+)
+
+
+def _redact_secrets(mapping: dict) -> dict:
+    """
+    Return a copy of a mapping with secret values masked.
+
+    Used when logging configuration so private keys and API keys
+    never reach the log stream.
+
+    :param mapping: The mapping to mask.
+    :return: A copy with secret values replaced by '***'.
+    """
+    return {k: "***" if k in _SECRET_KEYS and v else v for k, v in mapping.items()}
+
+
+# Mapping of commitment service option names to their config variables,
+# built once at module scope instead of per invocation.
+# Command line arguments take precedence over config values.
+_ARGS_CONFIG_PAIRS = (
+    ("vb_api_key", "VBASE_API_KEY"),
+    ("vb_cs_address", "VBASE_COMMITMENT_SERVICE_ADDRESS"),
+    ("vb_cs_node_rpc_url", "VBASE_COMMITMENT_SERVICE_NODE_RPC_URL"),
+    ("vb_cs_private_key", "VBASE_COMMITMENT_SERVICE_PRIVATE_KEY"),
+    ("vb_forwarder_url", "VBASE_FORWARDER_URL"),
+)
 
 
 CONTEXT_SETTINGS = cloup.Context.settings(
@@ -190,7 +333,14 @@ def cli(ctx, verbose):
     """vBase CLI for object commitment and verification"""
 
     setup_logging(verbose)
-    LOG.info("Logging level: %s", logging.getLogger().getEffectiveLevel())
+    # Guard the call so the root-logger level query is skipped entirely
+    # at the default verbosity.
+    if LOG.isEnabledFor(logging.INFO):
+        LOG.info("Logging level: %s", logging.getLogger().getEffectiveLevel())
+
+    # Drop any stdin token iterator left over from a previous in-process
+    # invocation so each invocation reads its own stdin.
+    _stdin_tokens.cache_clear()
 
     # Initialize context to an empty dictionary
     # to provide a shared state that persists during the execution of a command
@@ -236,91 +386,161 @@ def commitment_service(ctx, **kwargs):
     """Command group for interacting with a commitment service."""
 
     config = load_config()
-    LOG.debug("commitment_service(): config = %s", config)
-    LOG.debug("commitment_service(): kwargs = %s", kwargs)
+    # Redact secrets so private keys and API keys never reach the logs.
+    LOG.debug("commitment_service(): config = %s", _redact_secrets(config))
+    LOG.debug("commitment_service(): kwargs = %s", _redact_secrets(kwargs))
     # Override command line arguments with config values if necessary.
-    # Command line arguments take precedence over config values.
-    args_config_dict = {
-        "vb_api_key": "VBASE_API_KEY",
-        "vb_cs_address": "VBASE_COMMITMENT_SERVICE_ADDRESS",
-        "vb_cs_node_rpc_url": "VBASE_COMMITMENT_SERVICE_NODE_RPC_URL",
-        "vb_cs_private_key": "VBASE_COMMITMENT_SERVICE_PRIVATE_KEY",
-        "vb_forwarder_url": "VBASE_FORWARDER_URL",
-    }
-    for k, v in args_config_dict.items():
+    for k, v in _ARGS_CONFIG_PAIRS:
         if not kwargs[k]:
             kwargs[k] = config[v]
-    LOG.debug("commitment_service(): Updated kwargs =%s", kwargs)
+    LOG.debug("commitment_service(): Updated kwargs =%s", _redact_secrets(kwargs))
+    # Validate the option combination eagerly, but defer client
+    # construction (and the vbase/web3 import chain) until a subcommand
+    # actually needs the client: subcommand --help never connects.
     # Connect to the node cs if the node RPC URL is provided..
-    ctx.obj = {}
+    ctx.obj = {
+        "_cfg": (
+            kwargs["vb_cs_node_rpc_url"],
+            kwargs["vb_cs_address"],
+            kwargs["vb_cs_private_key"],
+        )
+    }
     if kwargs["vb_cs_node_rpc_url"]:
-        ctx.obj["vbc"] = VBaseClient(
-            Web3HTTPCommitmentService(
-                node_rpc_url=kwargs["vb_cs_node_rpc_url"],
-                commitment_service_address=kwargs["vb_cs_address"],
-                private_key=kwargs["vb_cs_private_key"],
+
+        def _make_vbc():
+            # pylint: disable=import-outside-toplevel
+            from vbase import VBaseClient, Web3HTTPCommitmentService
+
+            return VBaseClient(
+                Web3HTTPCommitmentService(
+                    node_rpc_url=kwargs["vb_cs_node_rpc_url"],
+                    commitment_service_address=kwargs["vb_cs_address"],
+                    private_key=kwargs["vb_cs_private_key"],
+                )
             )
-        )
+
     elif kwargs["vb_forwarder_url"]:
-        ctx.obj["vbc"] = VBaseClient(
-            ForwarderCommitmentService(
-                forwarder_url=kwargs["vb_forwarder_url"],
-                api_key=kwargs["vb_api_key"],
-                private_key=kwargs["vb_cs_private_key"],
+
+        def _make_vbc():
+            # pylint: disable=import-outside-toplevel
+            from vbase import VBaseClient, ForwarderCommitmentService
+
+            return VBaseClient(
+                ForwarderCommitmentService(
+                    forwarder_url=kwargs["vb_forwarder_url"],
+                    api_key=kwargs["vb_api_key"],
+                    private_key=kwargs["vb_cs_private_key"],
+                )
             )
-        )
+
     else:
         raise click.UsageError(
             "You must specify either --vb-cs-node-rpc-url or --vb-forwarder-url."
         )
+    ctx.obj["vbc_factory"] = _make_vbc
 
 
 cli.add_command(commitment_service)
 
 
+def _require_vbc(ctx):
+    """
+    Get the VBaseClient from the context.
+
+    The client is built on first access from the factory stored by the
+    enclosing command group, then cached in the context, so commands
+    that never touch the service (e.g., --help) skip the connection.
+
+    :param ctx: The Click context.
+    :return: The VBaseClient.
+    """
+    vbc = ctx.obj.get("vbc")
+    if vbc is None:
+        vbc_factory = ctx.obj.get("vbc_factory")
+        if vbc_factory is None:
+            raise click.UsageError(
+                "VBaseClient is not defined. Check the configuration."
+            )
+        vbc = ctx.obj["vbc"] = vbc_factory()
+    return vbc
+
+
 @cloup.command(
     aliases=["ao"],
     show_constraints=True,
 )
-# TODO: Move this to a common decorator.
-@cloup.option_group(
-    "Object CID options",
-    cloup.option("--object-cid", help="Specify object CID"),
-    cloup.option("--object-cid-stdin", is_flag=True, help="Read object CID from stdin"),
-    help="Options that define the content id (CID) for the object to be committed. ",
-    constraint=cloup.constraints.RequireExactly(1),
-)
-@cloup.option_group(
-    "Object CID format options",
-    cloup.option(
-        "--pad-object-cid",
-        is_flag=True,
-        help="Pad the object CID with zeros if necessary",
-    ),
-    help="Options that define the content id (CID) format. ",
+@needs_object_cid_options
+@cloup.option(
+    "--max-workers",
+    type=click.IntRange(min=1),
+    default=1,
+    help="Number of concurrent commitments in --object-cid-stdin batch mode",
 )
 @cloup.pass_context
-def add_object(ctx, object_cid, object_cid_stdin, pad_object_cid):
-    """Create an object commitment"""
+def add_object(ctx, object_cid, object_cid_stdin, pad_object_cid, max_workers):
+    """Create an object commitment
+
+    With --object-cid-stdin, every CID piped on stdin (one per line)
+    is committed in a single invocation.
+    --max-workers dispatches the batch commitments concurrently.
+    """
 
     LOG.info("Adding object...")
 
-    object_cid_value, _ = get_object_cid(
-        object_cid, object_cid_stdin, pad_object_cid, None
-    )
+    vbc = _require_vbc(ctx)
+
+    if object_cid_stdin:
+        if max_workers > 1:
+            # Commitments are network-bound on RPC round-trips,
+            # so a thread pool overlaps them.
+            # The commitment service must serialize transaction nonces
+            # for the shared signing key; keep the default sequential
+            # unless the service is known to handle concurrent commits.
+            # pylint: disable=import-outside-toplevel
+            from concurrent.futures import ThreadPoolExecutor
+
+            def _commit(raw_cid):
+                return add_object_impl(
+                    vbc, normalize_object_cid(raw_cid, pad_object_cid)
+                )
+
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                # executor.map() preserves stdin order in the output.
+                for receipt in executor.map(_commit, iter_stdin_cids()):
+                    # Print the receipt with double quotes to produce valid JSON.
+                    click.echo(
+                        "Added object = " + pprint.pformat(receipt).replace("'", '"')
+                    )
+            return
+
+        # Batch mode: stream CIDs line-by-line so each commitment starts
+        # as soon as its CID arrives instead of waiting for EOF.
+        for raw_cid in iter_stdin_cids():
+            object_cid_value = normalize_object_cid(raw_cid, pad_object_cid)
+            receipt = add_object_impl(vbc, object_cid_value)
+            # Print the receipt with double quotes to produce valid JSON.
+            click.echo("Added object = " + pprint.pformat(receipt).replace("'", '"'))
+        return
+
+    object_cid_value = get_object_cid(object_cid, object_cid_stdin, pad_object_cid)
+
+    receipt = add_object_impl(vbc, object_cid_value)
+    # Print the receipt with double quotes to produce valid JSON.
+    click.echo("Added object = " + pprint.pformat(receipt).replace("'", '"'))
+
 
-    # TODO: Factor out common code.
-    # Access vbc from ctx.
-    if not "vbc" in ctx.obj or not ctx.obj["vbc"]:
-        raise click.UsageError("VBaseClient is not defined. Check the configuration.")
-    vbc = ctx.obj["vbc"]
+def add_object_impl(vbc, object_cid_value: str) -> dict:
+    """
+    Make an object commitment using a validated object CID.
 
-    # Make the object commitment.
+    :param vbc: The VBaseClient to use for the commitment.
+    :param object_cid_value: The validated object CID.
+    :return: The commitment receipt.
+    """
     receipt = vbc.add_object(object_cid_value)
     # Format the transactionHash as a string to facilitate JSON conversions.
     receipt["transactionHash"] = receipt["transactionHash"].hex()
-    # Print the receipt with double quotes to produce valid JSON.
-    click.echo("Added object = " + pprint.pformat(receipt).replace("'", '"'))
+    return receipt
 
 
 commitment_service.add_command(add_object)
@@ -336,23 +556,7 @@ def fail(msg: str):
     aliases=["vo"],
     show_constraints=True,
 )
-# TODO: Move this to a common decorator.
-@cloup.option_group(
-    "Object CID options",
-    cloup.option("--object-cid", help="Specify object CID"),
-    cloup.option("--object-cid-stdin", is_flag=True, help="Read object CID from stdin"),
-    help="Options that define the content id (CID) for the object to be committed. ",
-    constraint=cloup.constraints.RequireExactly(1),
-)
-@cloup.option_group(
-    "Object CID format options",
-    cloup.option(
-        "--pad-object-cid",
-        is_flag=True,
-        help="Pad the object CID with zeros if necessary",
-    ),
-    help="Options that define the content id (CID) format. ",
-)
+@needs_object_cid_options
 @cloup.option_group(
     "Timestamp verification options",
     cloup.option("--timestamp", help="Commitment timestamp"),
@@ -382,18 +586,39 @@ def verify_object(
 
     LOG.info("Verifying object...")
 
-    object_cid_value, l_stdin_text_stream = get_object_cid(
-        object_cid, object_cid_stdin, pad_object_cid, None
-    )
+    object_cid_value = get_object_cid(object_cid, object_cid_stdin, pad_object_cid)
     LOG.debug("verify_object(): object_cid_value = %s", object_cid_value)
-    timestamp_value, _ = get_timestamp(timestamp, timestamp_stdin, l_stdin_text_stream)
+    timestamp_value = get_timestamp(timestamp, timestamp_stdin)
     LOG.debug("verify_object(): timestamp_value = %s", timestamp_value)
 
-    # TODO: Factor out common code.
-    # Access vbc from ctx.
-    if not "vbc" in ctx.obj or not ctx.obj["vbc"]:
-        raise click.UsageError("VBaseClient is not defined. Check the configuration.")
-    vbc = ctx.obj["vbc"]
+    vbc = _require_vbc(ctx)
+
+    closest_object = verify_object_impl(
+        vbc, object_cid_value, timestamp_value, timestamp_tol
+    )
+
+    click.echo(
+        "Found object commitment = " + pprint.pformat(closest_object).replace("'", '"')
+    )
+    click.echo("Timestamp verification succeeded.")
+
+
+def verify_object_impl(
+    vbc, object_cid_value: str, timestamp_value: pd.Timestamp, timestamp_tol: str
+) -> dict:
+    """
+    Verify an object commitment using validated arguments.
+
+    :param vbc: The VBaseClient to use for the verification.
+    :param object_cid_value: The validated object CID.
+    :param timestamp_value: The timezone-aware target commitment timestamp.
+    :param timestamp_tol: The commitment timestamp tolerance as a pd.Timedelta string.
+    :return: The verified object commitment closest to the target timestamp.
+    """
+    # pylint: disable=import-outside-toplevel
+    import numpy as np
+    import pandas as pd
+    from vbase import IndexingService
 
     # Find all object commitments for user and object.
     # TODO: Add find_user_object() and call that instead.
@@ -404,10 +629,16 @@ def verify_object(
         fail("No matching objects found.")
 
     # Find the closest commitment to the target timestamp.
-    # Convert timestamps in the list to pd.Timestamp objects and find the closest one.
-    closest_object = min(
-        l_objects, key=lambda x: abs(pd.Timestamp(x["timestamp"]) - timestamp_value)
+    # Parse all commitment timestamps in a single vectorized batch
+    # and take the argmin of the absolute distance to the target,
+    # instead of constructing a pd.Timestamp per element in a Python-level min().
+    commitment_timestamps = pd.to_datetime(
+        [obj["timestamp"] for obj in l_objects], utc=True
     )
+    # Subtract in the timedelta domain so the comparison is unit-safe
+    # regardless of the index resolution pandas infers.
+    closest_idx = int(np.abs(commitment_timestamps - timestamp_value).argmin())
+    closest_object = l_objects[closest_idx]
     LOG.debug("Closest object = %s", closest_object)
 
     # TODO: Technically, one of the other commitments may be close enough and valid.
@@ -423,24 +654,17 @@ def verify_object(
         fail("Commitment verification failed.")
 
     # Verify the timedelta for the closest commitment.
-    try:
-        # Try to convert the input to a pandas Timedelta
-        pd_timedelta = pd.Timedelta(timestamp_tol)
-    except ValueError as e:
-        raise click.BadParameter(f"Invalid pd.Timedelta: {timestamp_tol}. Error: {e}")
+    pd_timedelta = _parse_timestamp_tol(timestamp_tol)
 
-    closest_object_timedelta = abs(
-        pd.Timestamp(closest_object["timestamp"]) - timestamp_value
-    )
+    # Reuse the timestamp already parsed in the vectorized batch above
+    # instead of re-parsing the closest object's timestamp string.
+    closest_object_timedelta = abs(commitment_timestamps[closest_idx] - timestamp_value)
     LOG.debug("Closest object timedelta = %s", closest_object_timedelta)
 
     if closest_object_timedelta > pd_timedelta:
         fail("Timestamp verification failed.")
 
-    click.echo(
-        "Found object commitment = " + pprint.pformat(closest_object).replace("'", '"')
-    )
-    click.echo("Timestamp verification succeeded.")
+    return closest_object
 
 
 commitment_service.add_command(verify_object)
@@ -1,18 +1,68 @@
 """Configuration module for vBase CLI."""
 
-import json
+from functools import lru_cache
 import os
+from pathlib import Path
 import click
 
+# Prefer the C-extension JSON parser when available,
+# falling back to the stdlib module.
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
 
-# Define the path to the configuration file.
-# The configuration file is used to store persistent configuration settings.
-# These can be overridden by environment variables and command-line optios.
-CONFIG_FILE_PATH = os.path.join(
-    os.path.expanduser("~"), ".config", "vbase", "config.json"
+
+# Error messages for the operation validators,
+# built once at import time instead of on each failing call.
+_COMMIT_ERR_MSG = (
+    "For a commit (write) operation, you must specify either "
+    "[--vb-cs-node-rpc-url, --vb-cs-address, --vb-cs-private-key] "
+    "or [--vb-forwarder-url, --vb-api-key] with an optional --vb-cs-private-key."
+)
+_VERIFY_ERR_MSG = (
+    "For a verify (read) operation, you must specify either "
+    "[--vb-cs-node-rpc-url, --vb-cs-address] "
+    "or [--vb-forwarder-url, --vb-api-key]."
 )
 
 
+@lru_cache(maxsize=1)
+def _config_path() -> Path:
+    """
+    Return the path to the configuration file, computed once per process.
+
+    The configuration file is used to store persistent configuration settings.
+    These can be overridden by environment variables and command-line optios.
+
+    :return: The configuration file path.
+    """
+    return Path.home() / ".config" / "vbase" / "config.json"
+
+
+@lru_cache(maxsize=1)
+def _load_config_file(mtime):
+    """
+    Load and parse the configuration file.
+
+    The result is memoized on the file's modification time
+    so repeated CLI invocations within a process (e.g., in tests)
+    skip the open() and json.load() syscalls,
+    while edits to the file still invalidate the cache.
+
+    :param mtime: The configuration file's st_mtime, or None if the file does not exist.
+    :return: The parsed configuration dictionary.
+    """
+    if mtime is None:
+        return {}
+    return json_loads(_config_path().read_text(encoding="utf-8"))
+
+
+def clear_config_cache():
+    """Clear the memoized configuration file parse (e.g., between tests)."""
+    _load_config_file.cache_clear()
+
+
 def load_config():
     """
     Load configuration from file and environment variables.
@@ -27,11 +77,16 @@ def load_config():
     - Precedence: Command-line flags take precedence over environment variables,
       environment variables should take precedence over values in configuration files.
     """
-    config = {}
-    if os.path.exists(CONFIG_FILE_PATH):
-        with open(CONFIG_FILE_PATH, "r", encoding="utf-8") as f:
-            config = json.load(f)
+    try:
+        mtime = _config_path().stat().st_mtime
+    except OSError:
+        mtime = None
+    # Copy the cached dictionary so the environment variable overrides below
+    # do not leak into the cache.
+    config = dict(_load_config_file(mtime))
 
+    # Environment variables are read on every call since they are cheap to query
+    # and may change between invocations.
     for var_name in [
         "VBASE_COMMITMENT_SERVICE_NODE_RPC_URL",
         "VBASE_COMMITMENT_SERVICE_ADDRESS",
@@ -44,37 +99,34 @@ def load_config():
     return config
 
 
+# The validators are pure functions of their string arguments.
+# lru_cache memoizes the pass-through result for repeated invocations
+# with the same configuration; failing calls raise and are not cached.
+@lru_cache(maxsize=32)
 def validate_commit_operation(
     vb_cs_node_rpc_url, vb_cs_address, vb_cs_private_key, vb_forwarder_url, vb_api_key
 ):
     """Validate the options for a commit (write) operation."""
     # Direct node access: [--vb-cs-node-rpc-url, --vb-cs-address, --vb-cs-private-key]
-    if vb_cs_node_rpc_url and vb_cs_address and vb_cs_private_key:
+    if all((vb_cs_node_rpc_url, vb_cs_address, vb_cs_private_key)):
         return
     # Forwarder access: [--vb-forwarder-url, --vb-api-key] with an optional --vb-cs-private-key
-    if vb_forwarder_url and vb_api_key:
+    if all((vb_forwarder_url, vb_api_key)):
         return
     # Otherwise, invalid combination
-    raise click.UsageError(
-        "For a commit (write) operation, you must specify either "
-        "[--vb-cs-node-rpc-url, --vb-cs-address, --vb-cs-private-key] "
-        "or [--vb-forwarder-url, --vb-api-key] with an optional --vb-cs-private-key."
-    )
+    raise click.UsageError(_COMMIT_ERR_MSG)
 
 
+@lru_cache(maxsize=32)
 def validate_verify_operation(
     vb_cs_node_rpc_url, vb_cs_address, vb_forwarder_url, vb_api_key
 ):
     """Validate the options for a verify (read) operation."""
     # Direct node access: [--vb-cs-node-rpc-url, --vb-cs-address]
-    if vb_cs_node_rpc_url and vb_cs_address:
+    if all((vb_cs_node_rpc_url, vb_cs_address)):
         return
     # Forwarder access: [--vb-forwarder-url, --vb-api-key]
-    if vb_forwarder_url and vb_api_key:
+    if all((vb_forwarder_url, vb_api_key)):
         return
     # Otherwise, invalid combination
-    raise click.UsageError(
-        "For a verify (read) operation, you must specify either "
-        "[--vb-cs-node-rpc-url, --vb-cs-address] "
-        "or [--vb-forwarder-url, --vb-api-key]."
-    )
+    raise click.UsageError(_VERIFY_ERR_MSG)